@@ -0,0 +1,316 @@
+"""
+Columnar paper archive for Research Digest Agent
+================================================
+
+Exports digest papers to a Parquet dataset partitioned by month and primary
+category, appending new papers after each run. The reader functions memory-map
+the Parquet files and decode only the requested columns and partitions, so
+scanning titles never touches the abstract column.
+
+Layout:
+    archive/month=2026-10/category=cs.LG/part-<run>-0.parquet
+"""
+
+import json
+import logging
+import os
+import posixpath
+import re
+import shutil
+import sqlite3
+from collections import defaultdict
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+from pyarrow import fs
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+PAPER_SCHEMA = pa.schema([
+    ('id', pa.string()),
+    ('title', pa.string()),
+    ('abstract', pa.string()),
+    ('authors', pa.list_(pa.string())),
+    ('published', pa.timestamp('s')),
+    ('updated', pa.timestamp('s')),
+    ('categories', pa.list_(pa.string())),
+    ('primary_category', pa.string()),
+    ('arxiv_url', pa.string()),
+    ('pdf_url', pa.string()),
+    ('comment', pa.string()),
+    ('doi', pa.string()),
+    ('digest_date', pa.string()),
+    ('month', pa.string()),
+    ('category', pa.string()),
+])
+
+PARTITIONING = ds.partitioning(
+    pa.schema([('month', pa.string()), ('category', pa.string())]),
+    flavor='hive'
+)
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp from a paper dict, dropping sub-second parts"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None, microsecond=0)
+    except ValueError:
+        return None
+
+
+def _open_dataset(path: str, use_mmap: bool = True) -> ds.Dataset:
+    """Open the archive, memory-mapping files unless use_mmap is False"""
+    # An explicit schema keeps column lookups valid on an empty archive
+    return ds.dataset(
+        path,
+        schema=PAPER_SCHEMA,
+        format='parquet',
+        partitioning=PARTITIONING,
+        filesystem=fs.LocalFileSystem(use_mmap=use_mmap)
+    )
+
+
+def _write_partitions(table: pa.Table, path: str, prefix: str):
+    """Write a table as one new file in each partition it touches"""
+    ds.write_dataset(
+        table,
+        path,
+        format='parquet',
+        partitioning=PARTITIONING,
+        basename_template=f"{prefix}-{datetime.now().strftime('%Y%m%d%H%M%S%f')}-{{i}}.parquet",
+        existing_data_behavior='overwrite_or_ignore'
+    )
+
+
+def _drop_duplicate_ids(table: pa.Table) -> pa.Table:
+    """Keep the first row for each paper id"""
+    seen = set()
+    keep = []
+    for i, paper_id in enumerate(table.column('id').to_pylist()):
+        if paper_id not in seen:
+            seen.add(paper_id)
+            keep.append(i)
+    return table if len(keep) == table.num_rows else table.take(keep)
+
+
+def _build_filter(months: Optional[List[str]], categories: Optional[List[str]]):
+    """Build a partition filter expression for months and categories"""
+    expression = None
+    if months:
+        expression = ds.field('month').isin(months)
+    if categories:
+        category_filter = ds.field('category').isin(categories)
+        expression = category_filter if expression is None else expression & category_filter
+    return expression
+
+
+class ArchiveExporter:
+    """Appends digest papers to the partitioned Parquet archive"""
+
+    def __init__(self, archive_path: str = None):
+        self.archive_path = archive_path or config.ARCHIVE_PATH
+
+    def _exported_ids(self, months: List[str]) -> set:
+        """Return ids already archived in the given month partitions"""
+        try:
+            dataset = _open_dataset(self.archive_path)
+        except (FileNotFoundError, pa.ArrowInvalid):
+            return set()
+
+        table = dataset.to_table(columns=['id'], filter=ds.field('month').isin(months))
+        return set(table.column('id').to_pylist())
+
+    def _to_table(self, papers: List[Dict[str, Any]], digest_date: str) -> pa.Table:
+        """
+        Convert paper dicts to an Arrow table matching PAPER_SCHEMA.
+
+        Papers without a publication date are skipped: the month partition
+        comes from that date, and a paper must always land in the same month
+        for the duplicate check to find it.
+        """
+        columns = {name: [] for name in PAPER_SCHEMA.names}
+
+        skipped = 0
+        for paper in papers:
+            published = _parse_timestamp(paper.get('published'))
+            if not paper.get('id') or not published:
+                skipped += 1
+                continue
+
+            columns['id'].append(paper['id'])
+            columns['title'].append(paper.get('title'))
+            columns['abstract'].append(paper.get('abstract'))
+            columns['authors'].append(paper.get('authors') or [])
+            columns['published'].append(published)
+            columns['updated'].append(_parse_timestamp(paper.get('updated')))
+            columns['categories'].append(paper.get('categories') or [])
+            columns['primary_category'].append(paper.get('primary_category'))
+            columns['arxiv_url'].append(paper.get('arxiv_url'))
+            columns['pdf_url'].append(paper.get('pdf_url'))
+            columns['comment'].append(paper.get('comment'))
+            columns['doi'].append(paper.get('doi'))
+            columns['digest_date'].append(digest_date)
+            columns['month'].append(published.strftime('%Y-%m'))
+            columns['category'].append(paper.get('primary_category') or 'unknown')
+
+        if skipped:
+            logger.warning(f"Skipped {skipped} papers without an id or publication date")
+
+        return pa.Table.from_pydict(columns, schema=PAPER_SCHEMA)
+
+    def export_papers(self, papers: List[Dict[str, Any]], digest_date: str = None) -> int:
+        """
+        Append papers not yet in the archive.
+
+        Consecutive runs fetch overlapping windows, so ids already present in
+        the affected month partitions are skipped, as are papers without a
+        publication date.
+
+        Returns:
+            Number of papers written
+        """
+        digest_date = digest_date or datetime.now().strftime('%Y-%m-%d')
+        return self._append(self._to_table(papers, digest_date))
+
+    def _append(self, table: pa.Table) -> int:
+        """Write the rows of table whose ids are not archived yet"""
+        if table.num_rows == 0:
+            return 0
+
+        months = sorted(set(table.column('month').to_pylist()))
+        exported = self._exported_ids(months)
+
+        # Also drop duplicates within this batch
+        keep = []
+        for i, paper_id in enumerate(table.column('id').to_pylist()):
+            if paper_id not in exported:
+                exported.add(paper_id)
+                keep.append(i)
+
+        if not keep:
+            logger.info("No new papers to archive")
+            return 0
+
+        table = table.take(keep)
+        _write_partitions(table, self.archive_path, 'part')
+
+        logger.info(f"Archived {table.num_rows} papers to {self.archive_path}")
+        return table.num_rows
+
+    def backfill_from_database(self, db_path: str = None) -> int:
+        """Export every digest stored in the simple_digests table"""
+        conn = sqlite3.connect(db_path or config.DATABASE_PATH)
+        cursor = conn.cursor()
+        cursor.execute("SELECT date, papers_json FROM simple_digests ORDER BY date")
+
+        # One write for the whole backfill; earlier digests win on duplicate ids
+        tables = [
+            self._to_table(json.loads(papers_json or '[]'), date)
+            for date, papers_json in cursor
+        ]
+        conn.close()
+
+        total = self._append(pa.concat_tables(tables)) if tables else 0
+        logger.info(f"Backfilled {total} papers into the archive")
+        return total
+
+    def compact_finished_months(self, today: datetime = None) -> int:
+        """
+        Rewrite each finished month into a single file per category.
+
+        Every run appends a small file to each partition it touches; once a
+        month is over its partitions are merged so reads stay fast. Late
+        papers added to a compacted month are merged again on the next call.
+
+        The merged files are written to a staging directory and only moved
+        into place once complete, and the old files are removed last. An
+        interrupted compaction can therefore leave extra copies but never
+        lose rows, and duplicate ids are dropped on the next rewrite.
+
+        Returns:
+            Number of months compacted
+        """
+        # Leftovers of an interrupted compaction never replaced anything
+        staging_path = os.path.join(self.archive_path, '_compacting')
+        shutil.rmtree(staging_path, ignore_errors=True)
+
+        try:
+            # Without mmap so the old files can be removed on every platform
+            dataset = _open_dataset(self.archive_path, use_mmap=False)
+        except FileNotFoundError:
+            return 0
+
+        current_month = (today or datetime.now()).strftime('%Y-%m')
+        files_by_month = defaultdict(list)
+        for path in dataset.files:
+            match = re.search(r'month=(\d{4}-\d{2})', path)
+            if match and match.group(1) < current_month:
+                files_by_month[match.group(1)].append(path)
+
+        compacted = 0
+        for month, files in sorted(files_by_month.items()):
+            partitions = {posixpath.dirname(path.replace(os.sep, '/')) for path in files}
+            if len(files) == len(partitions):
+                continue
+
+            table = _drop_duplicate_ids(dataset.to_table(filter=ds.field('month') == month))
+            _write_partitions(table, staging_path, 'compact')
+
+            for root, _, names in os.walk(staging_path):
+                target_dir = os.path.join(self.archive_path, os.path.relpath(root, staging_path))
+                os.makedirs(target_dir, exist_ok=True)
+                for name in names:
+                    os.replace(os.path.join(root, name), os.path.join(target_dir, name))
+
+            for path in files:
+                os.remove(path)
+            shutil.rmtree(staging_path, ignore_errors=True)
+
+            compacted += 1
+            logger.info(f"Compacted {len(files)} archive files for {month}")
+
+        return compacted
+
+
+def read_archive(
+    columns: Optional[List[str]] = None,
+    months: Optional[List[str]] = None,
+    categories: Optional[List[str]] = None,
+    archive_path: str = None
+) -> pa.Table:
+    """
+    Read the archive as an Arrow table.
+
+    Args:
+        columns: Columns to load (e.g. ['id', 'title']); others are never read
+        months: Month partitions to include, as 'YYYY-MM'
+        categories: Primary category partitions to include (e.g. ['cs.LG'])
+        archive_path: Archive directory, defaults to config.ARCHIVE_PATH
+
+    Returns:
+        pyarrow.Table holding the decoded columns (files are read via mmap)
+    """
+    dataset = _open_dataset(archive_path or config.ARCHIVE_PATH)
+    return dataset.to_table(columns=columns, filter=_build_filter(months, categories))
+
+
+def load_archive_dataframe(
+    columns: Optional[List[str]] = None,
+    months: Optional[List[str]] = None,
+    categories: Optional[List[str]] = None,
+    archive_path: str = None
+):
+    """
+    Load the archive into a pandas DataFrame (requires pandas).
+
+    Takes the same arguments as read_archive. Arrow buffers are released
+    column by column during conversion to keep peak memory low.
+    """
+    table = read_archive(columns, months, categories, archive_path)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
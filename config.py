@@ -39,6 +39,16 @@ class Config:
     # Database
     DATABASE_PATH: str = "papers.db"
     
+    # Trending topics
+    TREND_WINDOW_DAYS: int = 7  # Recent window compared against the baseline
+    TREND_BASELINE_DAYS: int = 28  # Trailing baseline; older counts are dropped
+    TREND_PRUNE_MIN_COUNT: int = 2  # Terms with a lower total are pruned from closed days
+    TREND_MIN_COUNT: int = 3  # Minimum papers in the window for a trend
+    TREND_TOP_K: int = 10
+    
+    # Parquet paper archive (partitioned by month/category)
+    ARCHIVE_PATH: str = "archive"
+    
     def __post_init__(self):
         # Load from environment variables
         self.EMAIL_USER = os.getenv('EMAIL_USER', self.EMAIL_USER)
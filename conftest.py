@@ -0,0 +1,23 @@
+"""
+Shared test fixtures
+"""
+import pytest
+
+
+@pytest.fixture
+def make_paper():
+    """Factory for paper dicts shaped like get_working_digest output"""
+    def _make_paper(paper_id: str, published: str, title: str = None, **fields) -> dict:
+        paper = {
+            'id': paper_id,
+            'title': title if title is not None else f"title {paper_id}",
+            'abstract': '',
+            'authors': [],
+            'published': published,
+            'categories': ['cs.LG'],
+            'primary_category': 'cs.LG'
+        }
+        paper.update(fields)
+        return paper
+
+    return _make_paper
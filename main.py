@@ -104,6 +104,7 @@ class SimpleDigestAgent:
         
         date_str = datetime.now().strftime('%B %d, %Y')
         papers = digest['papers']
+        trends = digest.get('trends') or []
         
         html = f"""
         <!DOCTYPE html>
@@ -120,6 +121,9 @@ class SimpleDigestAgent:
                 .paper-abstract {{ margin-bottom: 10px; }}
                 .paper-links {{ margin-top: 10px; }}
                 .paper-links a {{ color: #007bff; text-decoration: none; margin-right: 15px; }}
+                .trends {{ background: #f5f8ff; border-radius: 6px; padding: 15px 20px; margin-bottom: 30px; }}
+                .trends h2 {{ font-size: 18px; margin-top: 0; }}
+                .trend-meta {{ color: #666; font-size: 13px; }}
             </style>
         </head>
         <body>
@@ -129,6 +133,23 @@ class SimpleDigestAgent:
             </div>
         """
         
+        if trends:
+            html += """
+            <div class="trends">
+                <h2>🔥 What's Heating Up</h2>
+                <ol>
+            """
+            for trend in trends:
+                html += f"""
+                    <li><strong>{trend['term']}</strong>
+                        <span class="trend-meta">{trend['recent_count']} papers in the last {config.TREND_WINDOW_DAYS} days • {trend['baseline_count']} in the {config.TREND_BASELINE_DAYS} days before</span>
+                    </li>
+                """
+            html += """
+                </ol>
+            </div>
+            """
+        
         for i, paper in enumerate(papers, 1):
             authors = ", ".join(paper['authors'][:3])
             if len(paper['authors']) > 3:
@@ -195,6 +216,22 @@ class SimpleDigestAgent:
             logger.error(f"❌ Error sending email: {e}")
             return False
     
+    def update_trends(self, digest: Dict[str, Any]):
+        """Add digest papers to the trend counts and attach ranked trends"""
+        try:
+            from trends import TrendTracker
+            
+            trend_tracker = TrendTracker(self.db_path)
+            trend_tracker.update(digest['papers'])
+            digest['trends'] = trend_tracker.top_trends()
+            
+            if digest['trends']:
+                logger.info(f"🔥 Top trends: {', '.join(t['term'] for t in digest['trends'][:5])}")
+            
+        except Exception as e:
+            logger.error(f"Error updating trends: {e}")
+            digest['trends'] = []
+    
     def save_digest_record(self, digest: Dict[str, Any], sent_successfully: bool):
         """Save digest to database"""
         try:
@@ -218,6 +255,20 @@ class SimpleDigestAgent:
         except Exception as e:
             logger.error(f"Error saving digest record: {e}")
     
+    def export_archive(self, digest: Dict[str, Any]):
+        """Append digest papers to the Parquet archive"""
+        try:
+            from archive_export import ArchiveExporter
+            
+            archive_exporter = ArchiveExporter()
+            archive_exporter.export_papers(
+                digest['papers'],
+                digest_date=datetime.now().strftime('%Y-%m-%d')
+            )
+            archive_exporter.compact_finished_months()
+        except Exception as e:
+            logger.error(f"Error exporting archive: {e}")
+    
     def run_simple_digest(self, dry_run: bool = False, send_email: bool = True) -> bool:
         """Run the SIMPLE digest pipeline"""
         try:
@@ -247,6 +298,9 @@ class SimpleDigestAgent:
                 logger.info("🔍 DRY RUN MODE - Not sending email or saving to database")
                 return True
             
+            # Update trend counts before sending so the email includes this run
+            self.update_trends(digest)
+            
             # Send email
             sent_successfully = False
             if send_email:
@@ -257,6 +311,7 @@ class SimpleDigestAgent:
             
             # Save record (always save, regardless of email option)
             self.save_digest_record(digest, sent_successfully)
+            self.export_archive(digest)
             
             logger.info("=" * 50)
             logger.info("✅ SIMPLE DIGEST COMPLETED SUCCESSFULLY")
@@ -306,6 +361,8 @@ def main():
                        help='Generate digest but do not send email')
     parser.add_argument('--test-config', action='store_true',
                        help='Test configuration and exit')
+    parser.add_argument('--export-archive', action='store_true',
+                       help='Export all saved digests to the Parquet archive and exit')
     
     args = parser.parse_args()
     
@@ -323,6 +380,19 @@ def main():
         else:
             return 1
     
+    # Backfill the Parquet archive if requested
+    if args.export_archive:
+        try:
+            from archive_export import ArchiveExporter
+            
+            archive_exporter = ArchiveExporter()
+            archive_exporter.backfill_from_database(agent.db_path)
+            archive_exporter.compact_finished_months()
+            return 0
+        except Exception as e:
+            logger.error(f"❌ Archive export failed: {e}")
+            return 1
+    
     # Run simple digest
     success = agent.run_simple_digest(
         dry_run=args.dry_run,
@@ -0,0 +1,147 @@
+"""
+Tests for the Parquet paper archive
+"""
+import json
+import os
+import shutil
+import sqlite3
+from datetime import datetime
+
+from archive_export import ArchiveExporter, read_archive
+
+
+def export_sample(exporter: ArchiveExporter, make_paper):
+    exporter.export_papers([
+        make_paper('a', '2026-09-10T00:00:00', abstract="long abstract"),
+        make_paper('b', '2026-10-01T00:00:00', primary_category='cs.CL'),
+        make_paper('c', '2026-10-02T00:00:00', primary_category=None),
+    ])
+
+
+def test_export_into_empty_archive_directory(tmp_path, make_paper):
+    exporter = ArchiveExporter(str(tmp_path))
+
+    assert exporter.export_papers([make_paper('1', '2026-10-01T00:00:00')]) == 1
+    assert exporter.export_papers([make_paper('1', '2026-10-01T00:00:00')]) == 0
+
+
+def test_compact_finished_months(tmp_path, make_paper):
+    exporter = ArchiveExporter(str(tmp_path))
+    for day in range(1, 4):
+        exporter.export_papers([
+            make_paper(f"sep{day}", f"2026-09-0{day}T00:00:00"),
+            make_paper(f"oct{day}", f"2026-10-0{day}T00:00:00"),
+        ])
+
+    assert exporter.compact_finished_months(today=datetime(2026, 10, 19)) == 1
+    assert len(os.listdir(tmp_path / 'month=2026-09' / 'category=cs.LG')) == 1
+    assert len(os.listdir(tmp_path / 'month=2026-10' / 'category=cs.LG')) == 3
+
+    table = read_archive(columns=['id'], archive_path=str(tmp_path))
+    assert sorted(table.column('id').to_pylist()) == [
+        'oct1', 'oct2', 'oct3', 'sep1', 'sep2', 'sep3'
+    ]
+
+
+def test_compaction_heals_an_interrupted_run(tmp_path, make_paper):
+    exporter = ArchiveExporter(str(tmp_path))
+    exporter.export_papers([make_paper('sep1', '2026-09-01T00:00:00')])
+    exporter.export_papers([make_paper('sep2', '2026-09-02T00:00:00')])
+
+    # An earlier compaction that moved its output but did not remove the old
+    # files, and a staging directory it left behind
+    partition = tmp_path / 'month=2026-09' / 'category=cs.LG'
+    original = sorted(os.listdir(partition))[0]
+    shutil.copy(partition / original, partition / f"compact-{original}")
+    staging = tmp_path / '_compacting' / 'month=2026-09' / 'category=cs.LG'
+    staging.mkdir(parents=True)
+    shutil.copy(partition / original, staging / original)
+
+    assert read_archive(columns=['id'], archive_path=str(tmp_path)).num_rows == 3
+
+    assert exporter.compact_finished_months(today=datetime(2026, 10, 19)) == 1
+    assert len(os.listdir(partition)) == 1
+    assert not (tmp_path / '_compacting').exists()
+
+    table = read_archive(columns=['id'], archive_path=str(tmp_path))
+    assert sorted(table.column('id').to_pylist()) == ['sep1', 'sep2']
+
+
+def test_papers_without_published_date_are_skipped(tmp_path, make_paper):
+    exporter = ArchiveExporter(str(tmp_path))
+
+    assert exporter.export_papers([make_paper('1', None)], digest_date='2026-10-19') == 0
+    assert exporter.export_papers([make_paper('1', '2026-09-30T00:00:00')]) == 1
+    assert exporter.export_papers([make_paper('1', None)], digest_date='2026-10-20') == 0
+
+    table = read_archive(columns=['id', 'month'], archive_path=str(tmp_path))
+    assert table.to_pylist() == [{'id': '1', 'month': '2026-09'}]
+
+
+def test_read_archive_loads_only_requested_columns(tmp_path, make_paper):
+    export_sample(ArchiveExporter(str(tmp_path)), make_paper)
+
+    table = read_archive(columns=['id', 'title'], archive_path=str(tmp_path))
+
+    assert table.schema.names == ['id', 'title']
+    assert sorted(table.column('title').to_pylist()) == ['title a', 'title b', 'title c']
+
+
+def test_read_archive_filters_months_and_categories(tmp_path, make_paper):
+    export_sample(ArchiveExporter(str(tmp_path)), make_paper)
+
+    def ids(**filters):
+        table = read_archive(columns=['id'], archive_path=str(tmp_path), **filters)
+        return sorted(table.column('id').to_pylist())
+
+    assert ids(months=['2026-10']) == ['b', 'c']
+    assert ids(categories=['cs.LG']) == ['a']
+    assert ids(months=['2026-10'], categories=['cs.CL']) == ['b']
+    assert ids(months=['2026-08']) == []
+
+
+def test_missing_category_goes_to_unknown_partition(tmp_path, make_paper):
+    export_sample(ArchiveExporter(str(tmp_path)), make_paper)
+
+    assert (tmp_path / 'month=2026-10' / 'category=unknown').is_dir()
+    table = read_archive(columns=['id', 'primary_category'], categories=['unknown'],
+                         archive_path=str(tmp_path))
+    assert table.to_pylist() == [{'id': 'c', 'primary_category': None}]
+
+
+def test_backfill_from_database(tmp_path, make_paper):
+    db_path = str(tmp_path / 'papers.db')
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE TABLE simple_digests (
+            date TEXT PRIMARY KEY,
+            papers_count INTEGER,
+            papers_json TEXT,
+            sent_successfully BOOLEAN
+        )
+    ''')
+    digests = {
+        '2026-09-05': [make_paper('a', '2026-09-01T00:00:00'), make_paper('b', '2026-09-04T00:00:00')],
+        '2026-09-06': [make_paper('b', '2026-09-04T00:00:00'), make_paper('c', '2026-09-06T00:00:00')],
+    }
+    for date, papers in digests.items():
+        conn.execute(
+            "INSERT INTO simple_digests VALUES (?, ?, ?, ?)",
+            (date, len(papers), json.dumps(papers), True)
+        )
+    conn.commit()
+    conn.close()
+
+    archive_path = tmp_path / 'archive'
+    exporter = ArchiveExporter(str(archive_path))
+
+    assert exporter.backfill_from_database(db_path) == 3
+    assert len(os.listdir(archive_path / 'month=2026-09' / 'category=cs.LG')) == 1
+
+    table = read_archive(columns=['id', 'digest_date'], archive_path=str(archive_path))
+    assert sorted(table.to_pylist(), key=lambda row: row['id']) == [
+        {'id': 'a', 'digest_date': '2026-09-05'},
+        {'id': 'b', 'digest_date': '2026-09-05'},
+        {'id': 'c', 'digest_date': '2026-09-06'},
+    ]
+    assert exporter.backfill_from_database(db_path) == 0
@@ -0,0 +1,105 @@
+"""
+Tests for trending topic detection
+"""
+import sqlite3
+from datetime import datetime, timedelta
+
+from trends import TrendTracker, extract_terms
+
+TODAY = datetime(2026, 10, 19)
+
+
+def simulate_runs(tracker: TrendTracker, make_paper, bursts: dict = None, days: int = 36):
+    """
+    Daily runs of 20 papers with one steady term. Each burst phrase is added
+    to its own share of papers on the last six days.
+    """
+    bursts = bursts or {"state space mamba": 5}
+    for offset in range(days, 0, -1):
+        day = TODAY - timedelta(days=offset)
+        papers = []
+        for k in range(20):
+            # Unique filler words so nearly every term has a per-day count of 1
+            title = f"filler{offset}x{k} other{offset}y{k}"
+            if k == 0:
+                title += " steadyterm"
+            if offset <= 6:
+                first = 0
+                for phrase, per_day in bursts.items():
+                    if first <= k < first + per_day:
+                        title += f" {phrase}"
+                    first += per_day
+            papers.append(make_paper(f"{offset}.{k}", day.isoformat(), title))
+        tracker.update(papers, today=day)
+
+
+def test_extract_terms_skips_stopwords():
+    terms = extract_terms("A survey of state space models")
+
+    assert "state space" in terms
+    assert "space models" in terms
+    assert "of" not in terms
+    assert "survey state" not in terms
+
+
+def test_update_counts_each_paper_once(tmp_path, make_paper):
+    tracker = TrendTracker(str(tmp_path / "trends.db"))
+    papers = [make_paper("1", TODAY.isoformat(), "mamba"), make_paper("2", TODAY.isoformat(), "mamba")]
+
+    assert tracker.update(papers, today=TODAY) == 2
+    assert tracker.update(papers, today=TODAY) == 0
+
+
+def test_steady_term_is_not_a_trend_and_burst_ranks_first(tmp_path, make_paper):
+    tracker = TrendTracker(str(tmp_path / "trends.db"))
+    simulate_runs(tracker, make_paper)
+
+    trends = tracker.top_trends(top_k=50, today=TODAY)
+    terms = [trend['term'] for trend in trends]
+
+    assert trends[0]['term'] in {"state space", "space mamba"}
+    assert trends[0]['recent_count'] == 30
+    assert trends[0]['baseline_count'] == 0
+    assert "steadyterm" not in terms
+
+    # Unigrams of the burst collapse into its bigrams
+    assert not {"state", "space", "mamba"} & set(terms)
+
+
+def test_burst_trends_on_a_fresh_database(tmp_path, make_paper):
+    tracker = TrendTracker(str(tmp_path / "trends.db"))
+    simulate_runs(tracker, make_paper, bursts={"mixture experts": 8}, days=6)
+
+    trends = tracker.top_trends(today=TODAY)
+
+    assert trends[0]['term'] == "mixture experts"
+    assert trends[0]['baseline_count'] == 0
+
+
+def test_bigrams_sharing_a_word_both_trend(tmp_path, make_paper):
+    tracker = TrendTracker(str(tmp_path / "trends.db"))
+    simulate_runs(tracker, make_paper, bursts={"reasoning models": 4, "diffusion models": 4})
+
+    terms = [trend['term'] for trend in tracker.top_trends(today=TODAY)]
+
+    assert "reasoning models" in terms
+    assert "diffusion models" in terms
+    assert "reasoning" not in terms
+    assert "diffusion" not in terms
+
+
+def test_steady_term_keeps_its_baseline_after_pruning(tmp_path, make_paper):
+    tracker = TrendTracker(str(tmp_path / "trends.db"))
+    simulate_runs(tracker, make_paper)
+
+    conn = sqlite3.connect(tracker.db_path)
+    baseline_count = conn.execute(
+        "SELECT SUM(count) FROM trend_counts WHERE term = ? AND day < ?",
+        ("steadyterm", (TODAY - timedelta(days=6)).strftime('%Y-%m-%d'))
+    ).fetchone()[0]
+    conn.close()
+    assert baseline_count == 30
+
+    # Only terms scoring above zero are reported
+    trends = tracker.top_trends(top_k=10 ** 6, min_count=1, today=TODAY)
+    assert "steadyterm" not in [trend['term'] for trend in trends]
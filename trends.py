@@ -0,0 +1,287 @@
+"""
+Trending topic detection for Research Digest Agent
+==================================================
+
+Keeps per-day n-gram document counts over paper titles and abstracts in
+SQLite, updated incrementally after each run, and scores terms by how much
+more often they appear this week than in the trailing baseline.
+"""
+
+import logging
+import re
+import sqlite3
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Set
+
+import numpy as np
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# Common English and paper-boilerplate words that never make useful trends
+STOPWORDS = {
+    "a", "about", "across", "after", "all", "also", "an", "and", "any", "are",
+    "as", "at", "be", "been", "being", "between", "both", "but", "by", "can",
+    "could", "do", "does", "each", "either", "for", "from", "further", "has",
+    "have", "here", "how", "however", "if", "in", "into", "is", "it", "its",
+    "less", "many", "may", "more", "most", "much", "new", "not", "novel", "of",
+    "on", "one", "only", "or", "other", "our", "over", "paper", "propose",
+    "proposed", "proposes", "results", "show", "shows", "such", "than", "that",
+    "the", "their", "them", "then", "there", "these", "they", "this", "those",
+    "through", "to", "two", "under", "use", "used", "using", "via", "was",
+    "we", "well", "were", "what", "when", "where", "which", "while", "who",
+    "will", "with", "within", "without", "work", "would", "yet",
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9\-]+")
+
+# A unigram is folded into a trending bigram containing it when its recent
+# paper count is at most this multiple of the bigram's
+UNIGRAM_COLLAPSE_RATIO = 1.2
+
+
+def extract_terms(text: str) -> Set[str]:
+    """Extract the set of unigrams and bigrams from a piece of text"""
+    terms = set()
+    previous = None
+
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        token = token.strip('-')
+        if len(token) < 3 or token in STOPWORDS:
+            previous = None
+            continue
+
+        terms.add(token)
+        if previous:
+            terms.add(f"{previous} {token}")
+        previous = token
+
+    return terms
+
+
+class TrendTracker:
+    """Incremental windowed term statistics with burst scoring"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or config.DATABASE_PATH
+        self.window_days = config.TREND_WINDOW_DAYS
+        self.baseline_days = config.TREND_BASELINE_DAYS
+        # Scoring never reads past the baseline, so nothing older is kept
+        self.retention_days = self.window_days + self.baseline_days
+        self.prune_min_count = config.TREND_PRUNE_MIN_COUNT
+        self._init_tables()
+
+    def _init_tables(self):
+        """Create the trend count tables if they do not exist"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS trend_papers (
+                paper_id TEXT PRIMARY KEY,
+                day TEXT
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS trend_counts (
+                day TEXT,
+                term TEXT,
+                count INTEGER,
+                PRIMARY KEY (day, term)
+            )
+        ''')
+
+        conn.commit()
+        conn.close()
+
+    def update(self, papers: List[Dict[str, Any]], today: datetime = None) -> int:
+        """
+        Add newly seen papers to the per-day counts and prune old data.
+
+        Papers already counted by an earlier run are skipped, so the
+        overlapping fetch windows of consecutive runs are only counted once.
+
+        Returns:
+            Number of new papers counted
+        """
+        today = today or datetime.now()
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        ids = [paper['id'] for paper in papers if paper.get('id')]
+        seen = set()
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            cursor.execute(
+                f"SELECT paper_id FROM trend_papers WHERE paper_id IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            seen.update(row[0] for row in cursor.fetchall())
+
+        day_counts = defaultdict(Counter)
+        new_papers = []
+        for paper in papers:
+            if not paper.get('id') or paper['id'] in seen:
+                continue
+            seen.add(paper['id'])
+
+            day = (paper.get('published') or today.isoformat())[:10]
+            day_counts[day].update(extract_terms(f"{paper['title']} {paper['abstract']}"))
+            new_papers.append((paper['id'], day))
+
+        cursor.executemany(
+            "INSERT OR IGNORE INTO trend_papers (paper_id, day) VALUES (?, ?)",
+            new_papers
+        )
+        cursor.executemany(
+            '''
+            INSERT INTO trend_counts (day, term, count) VALUES (?, ?, ?)
+            ON CONFLICT(day, term) DO UPDATE SET count = count + excluded.count
+            ''',
+            [(day, term, count) for day, counts in day_counts.items() for term, count in counts.items()]
+        )
+
+        self._prune(cursor, today)
+
+        conn.commit()
+        conn.close()
+
+        logger.info(f"Updated trend counts with {len(new_papers)} new papers")
+        return len(new_papers)
+
+    def _prune(self, cursor: sqlite3.Cursor, today: datetime):
+        """Keep storage bounded by dropping expired days and rare terms"""
+        retention_cutoff = (today - timedelta(days=self.retention_days)).strftime('%Y-%m-%d')
+        cursor.execute("DELETE FROM trend_counts WHERE day < ?", (retention_cutoff,))
+        cursor.execute("DELETE FROM trend_papers WHERE day < ?", (retention_cutoff,))
+
+        # Most terms appear in a single paper on any given day, so rarity is
+        # judged on a term's total over all retained days. Only days outside
+        # the current window are pruned, since those no longer receive papers
+        closed_cutoff = (today - timedelta(days=self.window_days)).strftime('%Y-%m-%d')
+        cursor.execute(
+            '''
+            DELETE FROM trend_counts
+            WHERE day < ? AND term IN (
+                SELECT term FROM trend_counts GROUP BY term HAVING SUM(count) < ?
+            )
+            ''',
+            (closed_cutoff, self.prune_min_count)
+        )
+
+    def top_trends(self, top_k: int = None, min_count: int = None,
+                   today: datetime = None) -> List[Dict[str, Any]]:
+        """
+        Rank terms by burst score: this window's document share versus the
+        trailing baseline share.
+
+        Returns:
+            List of dicts with term, recent count, baseline count and score
+        """
+        top_k = top_k or config.TREND_TOP_K
+        min_count = min_count or config.TREND_MIN_COUNT
+        today = (today or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+
+        total_days = self.window_days + self.baseline_days
+        start_day = (today - timedelta(days=total_days - 1)).strftime('%Y-%m-%d')
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT day, term, count FROM trend_counts WHERE day >= ?",
+            (start_day,)
+        )
+        rows = cursor.fetchall()
+        cursor.execute(
+            "SELECT day, COUNT(*) FROM trend_papers WHERE day >= ? GROUP BY day",
+            (start_day,)
+        )
+        paper_rows = cursor.fetchall()
+        conn.close()
+
+        if not rows:
+            return []
+
+        # Column index for each day, counted back from today (0 = today)
+        day_offsets = {}
+
+        def day_column(day: str) -> int:
+            if day not in day_offsets:
+                offset = (today - datetime.strptime(day, '%Y-%m-%d')).days
+                day_offsets[day] = min(max(offset, 0), total_days - 1)
+            return day_offsets[day]
+
+        term_index = {}
+        term_ids = np.fromiter(
+            (term_index.setdefault(term, len(term_index)) for _, term, _ in rows),
+            dtype=np.int64, count=len(rows)
+        )
+        day_ids = np.fromiter((day_column(day) for day, _, _ in rows), dtype=np.int64, count=len(rows))
+        counts = np.fromiter((count for _, _, count in rows), dtype=np.float64, count=len(rows))
+
+        matrix = np.zeros((len(term_index), total_days), dtype=np.float64)
+        np.add.at(matrix, (term_ids, day_ids), counts)
+
+        papers_per_day = np.zeros(total_days, dtype=np.float64)
+        for day, count in paper_rows:
+            papers_per_day[day_column(day)] += count
+
+        recent = matrix[:, :self.window_days].sum(axis=1)
+        baseline = matrix[:, self.window_days:].sum(axis=1)
+        recent_papers = papers_per_day[:self.window_days].sum()
+        baseline_papers = papers_per_day[self.window_days:].sum()
+
+        if recent_papers == 0 or not recent.any():
+            return []
+
+        if baseline_papers < recent_papers:
+            logger.info(
+                f"Trend baseline has only {int(baseline_papers)} papers; "
+                "scores lean on the average term share of this window"
+            )
+
+        # Baseline document share, smoothed by one pseudo-paper at this
+        # window's average term share so a short history still gives a
+        # realistic expected rate
+        prior_rate = recent.sum() / (len(term_index) * recent_papers)
+        baseline_rate = (baseline + prior_rate) / (baseline_papers + 1.0)
+        expected = baseline_rate * recent_papers
+        scores = (recent - expected) / np.sqrt(expected)
+        scores[recent < min_count] = -np.inf
+
+        terms = list(term_index)
+        n_words = np.fromiter((term.count(' ') + 1 for term in terms), dtype=np.int64, count=len(terms))
+
+        # A unigram that mostly occurs inside one trending bigram adds nothing
+        # to it; unigrams shared by several trending bigrams are kept
+        bigram_recent = defaultdict(float)
+        for idx in np.flatnonzero((scores > 0) & (n_words == 2)):
+            for word in terms[idx].split():
+                bigram_recent[word] = max(bigram_recent[word], recent[idx])
+        suppressed = {
+            idx for idx in np.flatnonzero((scores > 0) & (n_words == 1))
+            if recent[idx] <= UNIGRAM_COLLAPSE_RATIO * bigram_recent.get(terms[idx], 0.0)
+        }
+
+        n_candidates = min(top_k + len(suppressed), len(scores))
+        candidates = np.argpartition(-scores, n_candidates - 1)[:n_candidates]
+        # Highest score first, preferring bigrams over unigrams on ties
+        ranked = candidates[np.lexsort((-n_words[candidates], -scores[candidates]))]
+
+        trends = []
+        for idx in ranked:
+            if len(trends) >= top_k or not np.isfinite(scores[idx]) or scores[idx] <= 0:
+                break
+            if idx in suppressed:
+                continue
+
+            trends.append({
+                'term': terms[idx],
+                'recent_count': int(recent[idx]),
+                'baseline_count': int(baseline[idx]),
+                'score': round(float(scores[idx]), 2)
+            })
+
+        return trends